@@ -19,62 +19,98 @@ class BaseIncusMeta(type):
 
         Uses the ModelField as default value for class for all annotations.
         """
+        new_class_attrs = {}
         new_class_model_fields = {}
-        methods = []
-        secret_attributes = []
-        for item in attrs.items():
-            attr, value = item
-
-            if callable(value) or isinstance(value, property):
-                methods.append(item)
-            elif attr.startswith('_'):
-                secret_attributes.append(item)
+        for attr, value in attrs.items():
+            if (
+                callable(value)
+                or isinstance(value, property)
+                or attr.startswith('_')
+            ):
+                new_class_attrs[attr] = value
             else:
-                new_class_model_fields |= (item,)
-
-        model_fields = []
-        for attr in attrs.get('__annotations__', {}):
-            if attr.startswith('_'):
-                continue
-            model_fields.append((attr, ModelField(cls, attr)))
-            new_class_model_fields.setdefault(attr, Unset)
-
-        new_class = type(
-            name, bases, dict((*secret_attributes, *methods, *model_fields))
+                new_class_model_fields[attr] = value
+
+        public_annotations = [
+            attr
+            for attr in attrs.get('__annotations__', ())
+            if not attr.startswith('_')
+        ]
+        new_class_model_fields = (
+            dict.fromkeys(public_annotations, Unset) | new_class_model_fields
         )
-        new_class.__init__ = cls._init
-        if '__post_init__' not in vars(new_class):
+
+        new_class = type(name, bases, new_class_attrs)
+        for attr in public_annotations:
+            setattr(new_class, attr, ModelField(new_class, attr))
+        new_class._has_post_init = '__post_init__' in vars(new_class)
+        if not new_class._has_post_init:
             new_class.__post_init__ = cls._post_init
         new_class._model_fields = new_class_model_fields
+        new_class.__init__ = cls._create_init(new_class)
         return new_class
 
-    def _init(self, **kwargs):
+    @staticmethod
+    def _create_init(new_class):
         """
-        Initialize the incus model.
+        Generate the __init__ of the incus model.
 
-        Initialize the class with the required fields in the annotations.
+        The fields are known when the class is created, so the __init__ is
+        generated with one keyword-only parameter and one assignment per
+        field, as dataclasses does.
         """
-        kwargs = self._model_fields | kwargs
-        unsets = []
-        for field, value in kwargs.items():
-            if field not in self._model_fields:
-                continue
-            if value is Unset:
-                unsets.append(field)
-            elif not unsets:
-                setattr(self, field, value)
-
-        if unsets:
-            raise PyIncusException(
-                f'The required fields {unsets} are missing.'
-            )
-
-        self.__post_init__(**kwargs)
+        model_fields = new_class._model_fields
+        self_name = '__incus_self__' if 'self' in model_fields else 'self'
+        namespace = {
+            '__name__': new_class.__module__,
+            '_Unset': Unset,
+            '_missing': _missing,
+        }
+        parameters = ''
+        arguments = ''
+        body = []
+        for field, default in model_fields.items():
+            namespace[f'_default_{field}'] = default
+            parameters += f'{field}=_default_{field}, '
+            arguments += f'{field}={field}, '
+            body.append(f'    {self_name}.{field} = {field}')
+
+        required = [
+            field
+            for field, default in model_fields.items()
+            if default is Unset
+        ]
+        if required:
+            checks = ' or '.join(f'{field} is _Unset' for field in required)
+            missing = ', '.join(f'{field}={field}' for field in required)
+            body[:0] = [f'    if {checks}:', f'        _missing({missing})']
+        if new_class._has_post_init:
+            body.append(f'    {self_name}.__post_init__({arguments}**_kwargs)')
+
+        signature = f'*, {parameters}' if parameters else ''
+        lines = [
+            f'def __init__({self_name}, {signature}**_kwargs):',
+            *(body or ['    pass']),
+        ]
+        exec('\n'.join(lines), namespace)  # noqa: S102
+        init = namespace['__init__']
+        init.__qualname__ = f'{new_class.__qualname__}.__init__'
+        init.__doc__ = 'Initialize the incus model with its fields.'
+        return init
 
     def _post_init(self, **kwargs):
         """Will be called after the initialization."""
 
 
+def _missing(**fields):
+    """Raise for the required fields that were not set."""
+    unsets = [field for field, value in fields.items() if value is Unset]
+    raise PyIncusException(f'The required fields {unsets} are missing.')
+
+
 def incus_model(cls: type):
     """Apply BaseIncusMeta to class."""
-    return BaseIncusMeta(cls.__name__, tuple(cls.mro()), vars(cls))
+    attrs = dict(vars(cls))
+    attrs.pop('__dict__', None)
+    attrs.pop('__weakref__', None)
+    return BaseIncusMeta(cls.__name__, cls.__bases__, attrs)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from enum import Enum
 from typing import Any, Self
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from ..config import Unset
 from ..exceptions import PyIncusException
@@ -18,17 +20,38 @@ class ModelField:
 
     They will return FilterQuery when tested for equality or inequality.
     They will be instantiated by the BaseIncusMeta.
+    There is only one instance alive for each model class and field name.
     """
 
-    def __init__(self, cls: type, field_name: str) -> None:
+    __slots__ = ('__weakref__', '_repr', 'cls', 'field_name')
+
+    cls: type
+    field_name: str
+    _repr: str
+
+    def __new__(model_field_class, cls: type, field_name: str) -> ModelField:
         """
-        Init model_field class.
+        Get the model_field instance, creating it if needed.
 
         :param cls: The model class where this instance is a field.
         :param field_name: The field name of this instance.
         """
-        self.cls = cls
-        self.field_name = field_name
+        try:
+            model_fields = _model_field_cache[cls]
+        except KeyError:
+            model_fields = _model_field_cache[cls] = WeakValueDictionary()
+        model_field = model_fields.get(field_name)
+        if model_field is None:
+            model_field = super().__new__(model_field_class)
+            model_field.cls = cls
+            model_field.field_name = sys.intern(field_name)
+            model_field._repr = f'{cls.__name__}.{field_name}'
+            model_fields[field_name] = model_field
+        return model_field
+
+    def __getnewargs__(self) -> tuple[type, str]:
+        """Return the arguments to get this instance when copied or loaded."""
+        return (self.cls, self.field_name)
 
     def __eq__(self, other) -> FilterQuery:  # type: ignore
         """
@@ -54,25 +77,42 @@ class ModelField:
 
     def __repr__(self) -> str:
         """Representation of ModelField used for debugging."""
-        return f'{self.cls.__name__}.{self.field_name}'
+        return self._repr
 
     def __str__(self) -> str:
         """Field name used for queries."""
         return self.field_name
 
 
+# Both levels are weak: the models hold their fields and the fields hold
+# their models, so a strong reference here would keep them alive forever.
+_model_field_cache: WeakKeyDictionary[
+    type, WeakValueDictionary[str, ModelField]
+] = WeakKeyDictionary()
+
+
 class FilterOperation(Enum):
     """Operations able to filter fields by."""
 
-    NOT = 'not'
-    EQUALS = 'eq'
-    AND = 'and'
-    OR = 'or'
-    NOT_EQUALS = 'ne'
+    NOT = 'not', 'not'
+    EQUALS = 'eq', '=='
+    AND = 'and', 'and'
+    OR = 'or', 'or'
+    NOT_EQUALS = 'ne', '!='
 
-    def __str__(self) -> str:
-        """Return operation string representation for query."""
-        return self.value
+    repr_symbol: str
+
+    def __new__(cls, value: str, repr_symbol: str) -> FilterOperation:
+        """
+        Create the operation member.
+
+        :param value: The operation used in the incus query format.
+        :param repr_symbol: The operation used in the debugging representation.
+        """
+        member = object.__new__(cls)
+        member._value_ = value
+        member.repr_symbol = repr_symbol
+        return member
 
     @classmethod
     def get_model_options(cls):
@@ -80,6 +120,50 @@ class FilterOperation(Enum):
         return (cls.EQUALS, cls.NOT_EQUALS)
 
 
+def _same(first: Any, second: Any) -> bool:
+    """
+    Compare two query operands structurally.
+
+    ModelFields are compared by identity, since there is only one instance
+    for each model and field name and their equality operator builds a
+    FilterQuery instead of comparing them. Other values must also have the
+    same type, as 1, 1.0 and True are serialized differently.
+    """
+    if isinstance(first, ModelField) or isinstance(second, ModelField):
+        return first is second
+    return type(first) is type(second) and first == second
+
+
+def _estimate(
+    operand: Any, costs: dict[str, float], selectivities: dict[str, float]
+) -> tuple[float, float] | None:
+    """
+    Return the cost and selectivity of a query operand.
+
+    Only comparisons and their inversions are estimated, since moving a
+    conjunction or disjunction nested in another one would change the
+    meaning of the unparenthesized query string. None is returned for them.
+    """
+    if not isinstance(operand, FilterQuery):
+        return 1.0, 1.0
+
+    operation = operand.operation
+    if operation is FilterOperation.AND or operation is FilterOperation.OR:
+        return None
+    if operation is FilterOperation.NOT:
+        estimate = _estimate(operand.first_value, costs, selectivities)
+        if estimate is None:
+            return None
+        cost, selectivity = estimate
+        return cost, 1 - selectivity
+
+    field_name = str(operand.first_value)
+    selectivity = selectivities.get(field_name, 1.0)
+    if operation is FilterOperation.NOT_EQUALS:
+        selectivity = 1 - selectivity
+    return costs.get(field_name, 1.0), selectivity
+
+
 class FilterQuery:
     """
     Representation of queries for filter operations.
@@ -88,12 +172,8 @@ class FilterQuery:
     By using str(filter_query) the query in incus query format is returned.
     """
 
-    _repr_mapping = {
-        FilterOperation.EQUALS: '==',
-        FilterOperation.AND: 'and',
-        FilterOperation.OR: 'or',
-        FilterOperation.NOT_EQUALS: '!=',
-    }
+    __slots__ = ('_second_repr', 'first_value', 'operation', 'second_value')
+    __match_args__ = ('first_value', 'operation', 'second_value')
 
     def __init__(
         self,
@@ -109,7 +189,7 @@ class FilterQuery:
         :second_value: The value that the operation will be applied in relation
         to the first one. If the operation is a NOT, this should be Unset.
         """
-        if (second_value is Unset) ^ (operation == FilterOperation.NOT):
+        if (second_value is Unset) ^ (operation is FilterOperation.NOT):
             raise PyIncusException(
                 "Second value must always be set if operation isn't 'not'"
                 " and never be set if operation is 'not'"
@@ -118,35 +198,151 @@ class FilterQuery:
         self.operation = operation
         self.second_value = second_value
 
+    def __reduce__(self) -> tuple[type[FilterQuery], tuple[Any, ...]]:
+        """Rebuild the query when copied or loaded, keeping Unset values."""
+        if self.second_value is Unset:
+            return (FilterQuery, (self.first_value, self.operation))
+        return (
+            FilterQuery,
+            (self.first_value, self.operation, self.second_value),
+        )
+
+    def _chain(self) -> list[Any]:
+        """
+        Return the operands of the left chain of this query's operation.
+
+        The chain is walked in a loop instead of recursively, so long chains
+        of conjunctions or disjunctions are serialized without recursion.
+        """
+        operation = self.operation
+        operands = []
+        query: Any = self
+        while query.__class__ is FilterQuery and query.operation is operation:
+            operands.append(query.second_value)
+            query = query.first_value
+        operands.append(query)
+        operands.reverse()
+        return operands
+
+    @property
+    def _astuple(self) -> tuple[Any, FilterOperation, Any]:
+        """The first value, operation and second value of the query."""
+        return (self.first_value, self.operation, self.second_value)
+
     def __repr__(self):
         """Return a programming-like representation, clear for debugging."""
         if self.second_value is Unset:
             return f'not {self.first_value!r}'
-
-        return ' '.join((
-            repr(self.first_value),
-            str(self._repr_mapping[self.operation]),
-            repr(self.second_value),
-        ))
+        operation = self.operation
+        if operation is FilterOperation.AND or operation is FilterOperation.OR:
+            return f' {operation.repr_symbol} '.join(map(repr, self._chain()))
+
+        second_value = self.second_value
+        cached = getattr(self, '_second_repr', None)
+        if cached is not None and cached[0] is second_value:
+            second_repr = cached[1]
+        else:
+            second_repr = repr(second_value)
+            # Other values may be mutated after the query is built.
+            if isinstance(second_value, (str, int, float, bytes)):
+                self._second_repr = (second_value, second_repr)
+        return (
+            f'{self.first_value!r} {self.operation.repr_symbol} {second_repr}'
+        )
 
     def __str__(self):
         """Return a string with the filter following the incus format."""
         if self.second_value is Unset:
             return f'not {self.first_value}'
-
-        stringify = str if isinstance(self.second_value, type(self)) else repr
-        return f'{self.first_value} {self.operation} ' + stringify(
+        operation = self.operation
+        if operation is FilterOperation.AND or operation is FilterOperation.OR:
+            first, *others = self._chain()
+            return f' {operation.value} '.join((
+                str(first),
+                *(
+                    str(other)
+                    if other.__class__ is FilterQuery
+                    else repr(other)
+                    for other in others
+                ),
+            ))
+
+        stringify = str if self.second_value.__class__ is FilterQuery else repr
+        return f'{self.first_value} {self.operation.value} ' + stringify(
             self.second_value
         )
 
     def __eq__(self, other):
         """Evaluate equality between two queries."""
-        return str(self) == str(other)
+        return (
+            isinstance(other, FilterQuery)
+            and self.operation is other.operation
+            and _same(self.first_value, other.first_value)
+            and _same(self.second_value, other.second_value)
+        )
 
     def __hash__(self):
         """Hashes the query."""
         return hash(self.first_value)
 
+    def optimize(
+        self,
+        costs: dict[str, float] | None = None,
+        selectivities: dict[str, float] | None = None,
+    ) -> FilterQuery:
+        """
+        Return an equivalent query with its operands reordered.
+
+        Incus evaluates the filters from left to right, so the cheapest
+        operands of a conjunction or disjunction are moved to the front.
+        Ties are broken by selectivity: a conjunction starts by the operands
+        that match the fewest entries and a disjunction by the operands that
+        match the most. As queries are serialized without parentheses, only
+        chains of comparisons and their inversions are reordered; queries
+        mixing conjunctions and disjunctions are returned as they are.
+
+        :param costs: The cost of filtering by each field name, defaults to 1.
+        :param selectivities: The fraction of entries matched when filtering
+        by each field name, defaults to 1.
+        :returns: The reordered filter query.
+        """
+        operation = self.operation
+        if not (
+            operation is FilterOperation.AND or operation is FilterOperation.OR
+        ):
+            return self
+
+        costs, selectivities = costs or {}, selectivities or {}
+        operands = []
+        for operand in self._flatten():
+            estimate = _estimate(operand, costs, selectivities)
+            if estimate is None:
+                return self
+            operands.append((operand, *estimate))
+
+        if operation is FilterOperation.AND:
+            operands.sort(key=lambda operand: (operand[1], operand[2]))
+        else:
+            operands.sort(key=lambda operand: (operand[1], -operand[2]))
+
+        query = operands[0][0]
+        for operand, _, _ in operands[1:]:
+            query = FilterQuery(query, operation, operand)
+        return query
+
+    def _flatten(self) -> list[Any]:
+        """Return the operands of a chain of the same operation."""
+        operands = []
+        for operand in self._chain():
+            if (
+                isinstance(operand, FilterQuery)
+                and operand.operation is self.operation
+            ):
+                operands.extend(operand._flatten())
+            else:
+                operands.append(operand)
+        return operands
+
     def __and__(self, other) -> FilterQuery:
         """Return Filter Query for a conjunction."""
         return FilterQuery(self, FilterOperation.AND, other)
@@ -174,3 +174,44 @@ def test_post_init(faker):
     test_instance = TestClass(a=pre_value, _b=post_value)
     assert test_instance.a == pre_value + post_salt
     assert test_instance._b == post_value + post_salt
+
+
+def test_incus_model_keeps_original_bases():
+    """Test if an Incus Model keeps the bases of the decorated class."""
+
+    class Base:
+        pass
+
+    @incus_model
+    class TestClass(Base):
+        a: int
+
+    assert TestClass.__mro__ == (TestClass, Base, object)
+    assert TestClass(a=1).__dict__ == {'a': 1}
+
+
+def test_incus_model_init_belongs_to_model():
+    """Test if the generated __init__ is named after the model's module."""
+
+    @incus_model
+    class TestClass:
+        a: int
+
+    assert TestClass.__init__.__module__ == __name__
+    assert TestClass.__init__.__qualname__.endswith('TestClass.__init__')
+
+
+def test_incus_model_fields_belong_to_their_model():
+    """Test if models with the same field names have their own fields."""
+
+    @incus_model
+    class FirstClass:
+        name: str
+
+    @incus_model
+    class SecondClass:
+        name: str
+
+    assert FirstClass.name is not SecondClass.name
+    assert FirstClass.name.cls is FirstClass
+    assert repr(SecondClass.name) == 'SecondClass.name'
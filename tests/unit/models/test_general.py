@@ -1,5 +1,7 @@
 """Test ModelField and FilterQuery."""
 
+import copy
+import pickle  # noqa: S403
 import random
 
 import pytest
@@ -109,6 +111,27 @@ def test_filter_query_inversion(faker, model_field_generator, random_query):
     assert result == expected
 
 
+def test_filter_query_structural_equality(faker, model_field_generator):
+    """
+    Test equality between filter queries.
+
+    Filter queries are equal only if their fields, operations and values
+    are equal, even when comparing two model fields.
+    """
+    field1, field2 = model_field_generator(), model_field_generator()
+    value = faker.word()
+
+    assert (field1 == value) == FilterQuery(
+        ModelField(object, field1.field_name), FilterOperation.EQUALS, value
+    )
+    assert (field1 == value) != (field1 != value)
+    assert (field1 == field2) == (field1 == field2)
+    assert (field1 == field2) != (field1 == ModelField(int, field2.field_name))
+    assert (field1 == str(field2)) != (field1 == field2)
+    assert (field1 == 1) != (field1 == True)  # noqa: E712
+    assert (field1 == 1) != (field1 == 1.0)
+
+
 @pytest.mark.parametrize(
     'cls,class_name',
     (
@@ -133,6 +156,43 @@ def test_model_field_representation(cls, class_name, faker):
     assert result == expected
 
 
+def test_model_field_is_shared(faker):
+    """
+    Test the instances of the ModelField.
+
+    There should be a single instance for each model class and field name.
+    """
+    field_name = faker.word()
+    field = ModelField(object, field_name)
+
+    assert ModelField(object, field_name) is field
+    assert ModelField(FilterQuery, field_name) is not field
+
+
+@pytest.mark.parametrize(
+    'copier',
+    (
+        copy.copy,
+        copy.deepcopy,
+        lambda value: pickle.loads(pickle.dumps(value)),  # noqa: S301
+    ),
+)
+def test_filter_query_copy(faker, copier):
+    """
+    Test copying and pickling of a filter query.
+
+    The copied query should be equal to the original one, with the same
+    ModelField instance.
+    """
+    field = ModelField(object, faker.word())
+    query = (field == faker.word()) & ~(field != faker.word())
+
+    result = copier(query)
+
+    assert result == query
+    assert result.first_value.first_value is field
+
+
 def test_model_field_string(model_field_generator):
     """
     Test the string convertion of the ModelField.
@@ -180,6 +240,22 @@ def test_simple_filter_query_representation(
     assert result == expected
 
 
+def test_filter_query_representation_follows_value(faker):
+    """
+    Test the representation of a FilterQuery whose value was changed.
+
+    The representation should always show the current value.
+    """
+    field, value = ModelField(object, faker.word()), faker.word()
+    query = field == value
+    assert repr(query) == f'{field!r} == {value!r}'
+
+    query.second_value = other = value + faker.word()
+    result = repr(query)
+
+    assert result == f'{field!r} == {other!r}'
+
+
 @pytest.mark.parametrize(
     'operation,symbol',
     ((FilterOperation.AND, 'and'), (FilterOperation.OR, 'or')),
@@ -283,3 +359,133 @@ def test_invalid_filter_query(random_query, operation):
             FilterQuery(random_query(), operation, random_query())
         else:
             FilterQuery(random_query(), operation)
+
+
+def test_filter_query_structural_matching(faker, model_field_generator):
+    """
+    Test structural pattern matching of a filter query.
+
+    The query can be matched by its first value, operation and second value.
+    """
+    field, value = model_field_generator(), faker.word()
+    query = field != value
+
+    match query:
+        case FilterQuery(first, FilterOperation.NOT_EQUALS, second):
+            result = (first, second)
+        case _:
+            result = (None, None)
+
+    assert result[0] is field
+    assert result[1] == value
+    assert query._astuple[0] is field
+    assert query._astuple[1:] == (FilterOperation.NOT_EQUALS, value)
+
+    query.second_value = other = faker.word() + value
+    assert query._astuple[2] == other
+
+
+def test_filter_query_optimize_conjunction(faker):
+    """
+    Test reordering of a conjunction of filter queries.
+
+    The cheapest queries should come first and, on ties, the ones
+    matching fewer entries.
+    """
+    expensive, cheap, selective = (
+        ModelField(object, name) for name in ('expensive', 'cheap', 'other')
+    )
+    value = faker.word()
+    query = (expensive == value) & (cheap == value) & (selective == value)
+    expected = (selective == value) & (cheap == value) & (expensive == value)
+
+    result = query.optimize(
+        costs={'expensive': 10.0}, selectivities={'other': 0.1}
+    )
+
+    assert result == expected
+
+
+def test_filter_query_optimize_disjunction(faker):
+    """
+    Test reordering of a disjunction of filter queries.
+
+    On ties of cost, the queries matching more entries should come first,
+    inverted queries matching the entries their query does not match.
+    """
+    rare, common = ModelField(object, 'rare'), ModelField(object, 'common')
+    value = faker.word()
+    inverted = ~(rare == value)
+    query = (rare == value) | (common == value) | inverted
+    expected = (common == value) | inverted | (rare == value)
+
+    result = query.optimize(selectivities={'rare': 0.1, 'common': 0.9})
+
+    assert result == expected
+
+
+def test_filter_query_optimize_mixed_operations(faker):
+    """
+    Test reordering of a query mixing conjunctions and disjunctions.
+
+    As the query string has no parentheses, reordering its operands would
+    change its meaning, so it should be kept as it is.
+    """
+    first, second, third = (
+        ModelField(object, name) for name in ('first', 'second', 'third')
+    )
+    value = faker.word()
+    query = (first == value) & ((second == value) | (third == value))
+    expected = str(query)
+
+    result = query.optimize(costs={'first': 10.0})
+
+    assert str(result) == expected
+    assert str(((third == value) & query).optimize()) == (
+        f'third eq {value!r} and {expected}'
+    )
+
+
+@pytest.mark.parametrize(
+    'operation',
+    (FilterOperation.AND, FilterOperation.OR),
+)
+def test_chained_filter_query_is_flattened(random_query, operation):
+    """
+    Test chains of conjunctions or disjunctions of filter queries.
+
+    Chains of the same operation should be serialized as their nested
+    queries would be.
+    """
+    query1, query2, query3 = random_query(), random_query(), random_query()
+    nested = FilterQuery(query1, operation, query2)
+    query = FilterQuery(nested, operation, query3)
+    expected = (
+        f'{query1} {operation.value} {query2} {operation.value} {query3}'
+    )
+
+    result = str(query)
+
+    assert result == expected
+    assert repr(query) == f'{nested!r} {operation.repr_symbol} {query3!r}'
+
+
+def test_long_filter_query_chain(faker, model_field_generator):
+    """
+    Test the serialization of a long chain of filter queries.
+
+    Long chains of conjunctions should be serialized without recursing
+    once per operand.
+    """
+    field, values = model_field_generator(), faker.words(4000)
+    query = field == values[0]
+    for value in values[1:]:
+        query &= field == value
+    expected = ' and '.join(f'{field} eq {value!r}' for value in values)
+
+    result = str(query)
+
+    assert result == expected
+    assert repr(query) == ' and '.join(
+        f'{field!r} == {value!r}' for value in values
+    )